@@ -1,20 +1,72 @@
 """Fondat Salesforce bulk module."""
 
 import asyncio
+import functools
+import random
 
 from contextlib import suppress
-from collections import deque
-from collections.abc import Sequence
-from fondat.csv import typeddict_codec
+from collections.abc import Callable, Sequence
+from fondat.codec import get_codec, String
 from fondat.salesforce.client import Client
-from fondat.salesforce.sobjects import SObject, sobject_field_type
+from fondat.salesforce.sobjects import SObject, field_type_hint
 from fondat.salesforce.jobs import queries_resource
 from time import time
-from typing import Any, Optional, TypedDict
+from typing import Annotated, Any, Optional, TypedDict, get_args, get_origin
 
 
 _exclude_types = {"address", "location"}
 
+_poll_initial = 0.25  # seconds between polls while job is likely to complete quickly
+_poll_initial_period = 2  # seconds to poll at initial interval
+_poll_max = 30  # maximum seconds between polls
+_poll_jitter = 0.25  # maximum random seconds added to each poll interval
+
+_read_ahead = 4  # maximum number of result pages to fetch ahead of iteration
+
+_terminal_states = {"JobComplete", "Aborted", "Failed"}
+
+_cache_size = 256  # maximum number of generated query types and decoders to retain
+
+
+def _column_decoder(hint: Any) -> Optional[Callable[[str], Any]]:
+    """Return function to decode non-empty CSV values of a field, or None if passed through."""
+    args = [arg for arg in get_args(hint) if arg is not type(None)]
+    python_type = args[0] if args else hint
+    if get_origin(python_type) is Annotated:
+        python_type = get_args(python_type)[0]
+    if python_type in {str, Any}:
+        return None
+    return get_codec(String, python_type).decode
+
+
+@functools.lru_cache(maxsize=_cache_size)
+def _query_typeddict(fields: tuple[tuple[str, str, int], ...]) -> type:
+    """Return TypedDict for query results with fields of (name, type, length), in order."""
+    hints = {name: field_type_hint(field_type, length) for name, field_type, length in fields}
+    return TypedDict("QueryDict", hints)
+
+
+@functools.lru_cache(maxsize=_cache_size)
+def _rows_decoder(td: type, header: tuple[str, ...]) -> Callable[[list[list[str]]], list[dict]]:
+    """
+    Generate a function that decodes CSV rows with the specified header into dicts.
+
+    The generated function builds each dict with a literal expression per column, so no
+    per-field dispatch occurs while decoding rows. Empty values decode as None.
+    """
+    hints = td.__annotations__
+    namespace = {}
+    items = []
+    for n, name in enumerate(header):
+        if (decode := _column_decoder(hints[name])) is None:
+            expr = f"r[{n}] or None"
+        else:
+            namespace[f"d{n}"] = decode
+            expr = f"d{n}(r[{n}]) if r[{n}] else None"
+        items.append(f"{name!r}: {expr}")
+    exec(f"def decode(rows):\n    return [{{{', '.join(items)}}} for r in rows]", namespace)
+    return namespace["decode"]
+
 
 class SObjectQuery:
     """
@@ -55,7 +107,9 @@ class SObjectQuery:
                 raise ValueError(f"unknown field: {name}")
             if field.type in _exclude_types:
                 raise ValueError(f"cannot query {field.type} type field: {name}")
-        self.td = TypedDict("QueryDict", {f: sobject_field_type(indexed[f]) for f in fields})
+        self.td = _query_typeddict(
+            tuple((f, indexed[f].type, indexed[f].length) for f in fields)
+        )
         self.stmt = f"SELECT {', '.join(fields)} FROM {sobject.name}"
         if where:
             self.stmt += f" WHERE {where}"
@@ -66,21 +120,33 @@ class SObjectQuery:
         self.timeout = timeout
         self.query = None
         self.results = None
+        self.index = 0
         self.header = None
         self.cursor = None
+        self._info = None
+        self._pages = None
+        self._fetcher = None
 
     async def info(self):
-        return await self.query.get()
+        """Return information about the query job; retained once job reaches terminal state."""
+        if self._info is not None:
+            return self._info
+        info = await self.query.get()
+        if info.state in _terminal_states:
+            self._info = info
+        return info
 
     async def _await_complete(self):
         """Wait for job to be complete."""
         start = time()
-        sleep = 1
+        sleep = _poll_initial
         while (state := (await self.info()).state) in {"UploadComplete", "InProgress"}:
-            if self.timeout and time() - start >= self.timeout:
+            elapsed = time() - start
+            if self.timeout and elapsed >= self.timeout:
                 raise asyncio.exceptions.TimeoutError
-            await asyncio.sleep(sleep)
-            sleep = min(sleep * 2, 60)
+            await asyncio.sleep(sleep + random.uniform(0, _poll_jitter))
+            if elapsed >= _poll_initial_period:
+                sleep = min(sleep * 1.5, _poll_max)
         if state != "JobComplete":
             raise RuntimeError(f"unexpected job state: {state}")
 
@@ -93,6 +159,11 @@ class SObjectQuery:
         return self
 
     async def __aexit__(self, *args):
+        if self._fetcher is not None:
+            self._fetcher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._fetcher
+            self._fetcher = None
         if self.results is None:
             with suppress(asyncio.exceptions.TimeoutError):
                 await self._await_complete()
@@ -104,17 +175,41 @@ class SObjectQuery:
             raise RuntimeError("must iterate within async context")
         return self
 
+    async def _fetch_pages(self, cursor: Optional[bytes]):
+        """Fetch result pages ahead of iteration, following locators in sequence."""
+        try:
+            while True:
+                page = await self.query.results(limit=self.page_size or 1000, cursor=cursor)
+                await self._pages.put(page)
+                if (cursor := page.cursor) is None:
+                    break
+        except Exception as e:
+            await self._pages.put(e)
+
     async def _next_page(self):
-        page = await self.query.results(limit=self.page_size or 1000, cursor=self.cursor)
-        self.results = deque(page.items)
+        if self._fetcher is None or (self._fetcher.done() and self._pages.empty()):
+            self._pages = asyncio.Queue(maxsize=_read_ahead)
+            self._fetcher = asyncio.create_task(self._fetch_pages(self.cursor))
+        page = await self._pages.get()
+        if isinstance(page, Exception):
+            self._fetcher = None  # next attempt fetches again from current cursor
+            raise page
+        header, rows = page.items[0], page.items[1:]
+        if header != self.header:
+            self.header = header
+            self.decode = _rows_decoder(self.td, tuple(header))
+        self.results = self.decode(rows)
+        self.index = 0
         self.cursor = page.cursor
-        self.codec = typeddict_codec(self.td, self.results.popleft())
 
     async def __anext__(self) -> dict[str, Any]:
         if self.results is None:
             await self._await_complete()
-        if self.results is None or (not self.results and self.cursor):
             await self._next_page()
-        if not self.results and not self.cursor:
-            raise StopAsyncIteration
-        return self.codec.decode(self.results.popleft())
+        while self.index >= len(self.results):
+            if not self.cursor:
+                raise StopAsyncIteration
+            await self._next_page()
+        row = self.results[self.index]
+        self.index += 1
+        return row
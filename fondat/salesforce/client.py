@@ -4,21 +4,49 @@ import aiohttp
 import asyncio
 import fondat.error
 import logging
+import time
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine
 from contextlib import asynccontextmanager
+from functools import cached_property
 from typing import Any, Literal, Optional
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 _logger = logging.getLogger(__name__)
 
 
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """Read and decode a JSON response body, using orjson if it is installed."""
+    return _json_loads(await response.read())
+
+
 class Client:
     """
     Salesforce API client.
 
+    A single client session should be shared across all requests, so that connections to
+    the Salesforce instance are kept alive and reused.
     """
 
+    @staticmethod
+    def create_default_session() -> aiohttp.ClientSession:
+        """
+        Create a client session with a connection pool suited for Salesforce API requests.
+
+        The caller is responsible for closing the session.
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=60
+            ),
+            timeout=aiohttp.ClientTimeout(total=120),
+        )
+
     @classmethod
     async def create(
         cls,
@@ -27,6 +55,7 @@ class Client:
         version: str,
         authenticate: Callable[[], Coroutine[Any, Any, Any]],
         retries: int = 3,
+        metadata_ttl: int = 3600,
     ):
         """
         Create a Salesforce API client.
@@ -36,6 +65,7 @@ class Client:
         • version: API version to use; example: "54.0"
         • authenticate: coroutine function to authenticate and return an access token
         • retries: number of times to retry server errors
+        • metadata_ttl: seconds to cache SObject metadata; 0 disables caching
 
         Server error retries backoff exponentially.
         """
@@ -48,6 +78,10 @@ class Client:
         self.authenticate = authenticate
         self.retries = retries
         self.token = None
+        self._auth_lock = asyncio.Lock()
+        self.metadata_ttl = metadata_ttl
+        self._metadata_cache = {}
+        self._describe_inflight = {}  # sobject name → future of in-flight describe
         self.resources = await service_resource(self).resources()
 
         return self
@@ -59,6 +93,60 @@ class Client:
         except KeyError:
             raise fondat.error.NotFoundError(f"unknown resource: {resource}")
 
+    @cached_property
+    def sobjects_path(self) -> str:
+        """Path to the sobjects resource; resolved on first use."""
+        return self.path("sobjects")
+
+    @cached_property
+    def jobs_query_path(self) -> str:
+        """Path to the bulk query jobs resource; resolved on first use."""
+        return f"{self.path('jobs')}/query"
+
+    def get_cached_metadata(self, name: str) -> Any:
+        """Return cached SObject metadata, or None if not cached or expired."""
+        if entry := self._metadata_cache.get(name):
+            expires, metadata = entry
+            if time.monotonic() < expires:
+                return metadata
+            del self._metadata_cache[name]
+        return None
+
+    def cache_metadata(self, name: str, metadata: Any) -> None:
+        """Cache SObject metadata."""
+        if self.metadata_ttl > 0:
+            self._metadata_cache[name] = (time.monotonic() + self.metadata_ttl, metadata)
+
+    def invalidate_metadata(self, name: Optional[str] = None) -> None:
+        """Invalidate cached metadata for the specified SObject, or all if not specified."""
+        if name is None:
+            self._metadata_cache.clear()
+        else:
+            self._metadata_cache.pop(name, None)
+
+    def describe_task(
+        self, name: str, describe: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Future:
+        """
+        Return task that describes the specified SObject, shared by concurrent callers.
+
+        A new task is started from the describe coroutine function only if no describe of the
+        SObject is already in flight. Callers should await the task through asyncio.shield, so
+        that a cancelled caller does not cancel the describe for others.
+        """
+        if (task := self._describe_inflight.get(name)) is None:
+            task = asyncio.ensure_future(describe())
+            self._describe_inflight[name] = task
+
+            def done(task):
+                if self._describe_inflight.get(name) is task:
+                    del self._describe_inflight[name]
+                if not task.cancelled():
+                    task.exception()  # retrieved even if all callers were cancelled
+
+            task.add_done_callback(done)
+        return task
+
     @asynccontextmanager
     async def request(
         self,
@@ -86,10 +174,13 @@ class Client:
         server_errors = 0
 
         while True:
-            if not self.token:
-                self.token = await self.authenticate(self.session)
-            headers["Authorization"] = f"Bearer {self.token.access_token}"
-            url = f"{self.token.instance_url}{path}"
+            if not (token := self.token):
+                async with self._auth_lock:  # only one concurrent authentication
+                    if not self.token:
+                        self.token = await self.authenticate(self.session)
+                token = self.token
+            headers["Authorization"] = f"Bearer {token.access_token}"
+            url = f"{token.instance_url}{path}"
             async with self.session.request(
                 method=method,
                 url=url,
@@ -105,7 +196,8 @@ class Client:
                 elif response.status == 401 and not auth_error:  # only retry once
                     _logger.debug("retrying authentication")
                     auth_error = True
-                    token = None
+                    if self.token is token:  # not already reauthenticated concurrently
+                        self.token = None
                     continue
                 elif 500 <= response.status <= 599 and server_errors < self.retries:
                     _logger.debug(f"retrying server error")
@@ -1,15 +1,18 @@
 """Fondat Salesforce asynchronous jobs module."""
 
+import asyncio
+import codecs
 import csv
 import http
 import io
 
+from collections.abc import AsyncIterable
 from datetime import datetime
 from fondat.codec import get_codec, JSON
 from fondat.data import datacls
 from fondat.error import NotFoundError
 from fondat.resource import resource, operation, query, mutation
-from fondat.salesforce.client import Client
+from fondat.salesforce.client import Client, read_json
 from typing import Literal, Optional
 
 
@@ -69,10 +72,63 @@ class _CreateQueryRequest:
     lineEnding: Optional[LineEnding]
 
 
+_chunk_size = 64 * 1024  # size of response chunks to parse as they are received
+
+
+def _complete_records_end(text: str, quoted: bool = False) -> int:
+    """
+    Return index after last newline in text that terminates a CSV record, or 0 if none.
+
+    Parameters:
+    • text: text to search for record terminators
+    • quoted: whether text starts within a quoted value
+    """
+    quotes = text.count('"') + quoted
+    end = len(text)
+    while (n := text.rfind("\n", 0, end)) != -1:
+        quotes -= text.count('"', n + 1, end)
+        if quotes % 2 == 0:  # newline is not within a quoted value
+            return n + 1
+        end = n
+    return 0
+
+
+def _parse_csv(text: str) -> list[list[str]]:
+    with io.StringIO(text) as sio:
+        return list(csv.reader(sio))
+
+
+async def _read_csv(chunks: AsyncIterable[bytes]) -> list[list[str]]:
+    """Parse complete CSV records as UTF-8 encoded chunks arrive."""
+    decoder = codecs.getincrementaldecoder("utf-8")()  # bulk API results are always UTF-8
+    items = []
+    pending = []  # text received after last complete record
+    quoted = False  # whether pending text ends within a quoted value
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        if end := _complete_records_end(text, quoted):  # only scan newly received text
+            pending.append(text[:end])
+            items.extend(_parse_csv("".join(pending)))
+            pending = [text[end:]]
+            quoted = text.count('"', end) % 2 == 1
+            await asyncio.sleep(0)  # don't block event loop if response is already buffered
+        else:
+            pending.append(text)
+            quoted ^= text.count('"') % 2 == 1
+    if text := "".join(pending) + decoder.decode(b"", final=True):
+        items.extend(_parse_csv(text))
+    return items
+
+
+_query_codec = get_codec(JSON, Query)
+_queries_response_codec = get_codec(JSON, _QueriesResponse)
+_create_query_request_codec = get_codec(JSON, _CreateQueryRequest)
+
+
 def queries_resource(client: Client):
     """Create asynchronous jobs resource."""
 
-    path = f"{client.resources['jobs']}/query"
+    path = client.jobs_query_path
 
     @resource
     class QueryResource:
@@ -86,7 +142,7 @@ def queries_resource(client: Client):
             """Get information about a query job."""
 
             async with client.request("GET", self.path) as response:
-                return get_codec(JSON, Query).decode(await response.json())
+                return _query_codec.decode(await read_json(response))
 
         @operation
         async def delete(self):
@@ -124,8 +180,7 @@ def queries_resource(client: Client):
             ) as response:
                 if response.status == http.HTTPStatus.NO_CONTENT.value:
                     raise NotFoundError  # no results yet
-                with io.StringIO(await response.text()) as sio:
-                    items = [row for row in csv.reader(sio)]
+                items = await _read_csv(response.content.iter_chunked(_chunk_size))
                 locator = response.headers.get("Sforce-Locator")
             return QueryResultsPage(
                 items=items, cursor=locator.encode() if locator != "null" else None
@@ -143,7 +198,7 @@ def queries_resource(client: Client):
             async with client.request(
                 method="GET", path=cursor.decode() if cursor else path, params=params
             ) as response:
-                json = get_codec(JSON, _QueriesResponse).decode(await response.json())
+                json = _queries_response_codec.decode(await read_json(response))
             return QueriesPage(
                 items=json.records,
                 cursor=json.nextRecordsUrl.encode() if json.nextRecordsUrl else None,
@@ -157,9 +212,9 @@ def queries_resource(client: Client):
             async with client.request(
                 method="POST",
                 path=f"{path}/",
-                json=get_codec(JSON, _CreateQueryRequest).encode(request),
+                json=_create_query_request_codec.encode(request),
             ) as response:
-                return get_codec(JSON, Query).decode(await response.json())
+                return _query_codec.decode(await read_json(response))
 
         def __getitem__(self, id: str) -> QueryResource:
             return QueryResource(id)
@@ -1,11 +1,14 @@
 """Fondat Salesforce sObject module."""
 
+import asyncio
+import functools
+
 from datetime import date, datetime
 from fondat.codec import JSON, get_codec
 from fondat.data import datacls, make_datacls
 from fondat.error import NotFoundError
 from fondat.resource import resource, operation, query
-from fondat.salesforce.client import Client
+from fondat.salesforce.client import Client, read_json
 from fondat.validation import MaxLen
 from typing import Annotated, Any, Literal, Optional
 
@@ -212,22 +215,55 @@ class SObjects:
     sobjects: list[SObjectBasic]
 
 
-def sobject_field_type(field: Field) -> Any:
-    """Return the Python type associated with an SObject field."""
+_sobject_codec = get_codec(JSON, SObject)
+_sobjects_codec = get_codec(JSON, SObjects)
+
+_cache_size = 256  # maximum number of generated data classes to retain
+
+
+@functools.cache
+def field_type_hint(field_type: str, length: int) -> Any:
+    """
+    Return the Python type associated with a Salesforce field type.
+
+    Parameters:
+    • field_type: Salesforce field type; example: "string"
+    • length: maximum length of field value; 0 if not limited
+    """
 
     try:
-        result = _type_mappings[field.type]
+        result = _type_mappings[field_type]
     except KeyError:
-        raise TypeError(f"unsupported field type: {field.type}")
-    if field.length != 0:
-        result = Annotated[result, MaxLen(field.length)]
+        raise TypeError(f"unsupported field type: {field_type}")
+    if length != 0:
+        result = Annotated[result, MaxLen(length)]
     return Optional[result]
 
 
+def sobject_field_type(field: Field) -> Any:
+    """Return the Python type associated with an SObject field."""
+
+    return field_type_hint(field.type, field.length)
+
+
+@functools.lru_cache(maxsize=_cache_size)
+def _sobject_datacls(name: str, fields: tuple[tuple[str, str, int], ...]) -> type:
+    return make_datacls(
+        name,
+        [
+            (field_name, field_type_hint(field_type, length))
+            for field_name, field_type, length in fields
+        ],
+    )
+
+
+_describe_concurrency = 8
+
+
 def sobjects_metadata_resource(client: Client):
     """Return resource representing SObject metadata."""
 
-    path = f"{client.resources['sobjects']}"
+    path = client.sobjects_path
 
     @resource
     class SObjectMetadataResource:
@@ -239,12 +275,18 @@ def sobjects_metadata_resource(client: Client):
         @query
         async def describe(self) -> SObject:
             """Get SObject metadata."""
+            if metadata := client.get_cached_metadata(self.name):
+                return metadata
+            return await asyncio.shield(client.describe_task(self.name, self._describe))
+
+        async def _describe(self) -> SObject:
             async with client.request(
                 method="GET", path=f"{path}/{self.name}/describe"
             ) as response:
-                metadata = get_codec(JSON, SObject).decode(await response.json())
+                metadata = _sobject_codec.decode(await read_json(response))
             if metadata.name != self.name:
                 raise NotFoundError
+            client.cache_metadata(self.name, metadata)
             return metadata
 
     @resource
@@ -255,7 +297,28 @@ def sobjects_metadata_resource(client: Client):
         async def get(self) -> SObjects:
             """Get a list of objects."""
             async with client.request(method="GET", path=f"{path}/") as response:
-                return get_codec(JSON, SObjects).decode(await response.json())
+                return _sobjects_codec.decode(await read_json(response))
+
+        @query
+        async def describe_many(self, names: list[str]) -> list[SObject]:
+            """
+            Get metadata for multiple SObjects concurrently.
+
+            Results are returned in the same order as the requested names.
+            """
+            semaphore = asyncio.Semaphore(_describe_concurrency)
+
+            async def describe(name: str) -> SObject:
+                async with semaphore:
+                    return await self[name].describe()
+
+            tasks = [asyncio.ensure_future(describe(name)) for name in names]
+            try:
+                return await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:  # don't leave sibling describes running
+                    task.cancel()
+                raise
 
         def __getitem__(self, name: str) -> SObjectMetadataResource:
             return SObjectMetadataResource(name)
@@ -271,9 +334,8 @@ async def sobject_data_resource(client: Client, name: str):
     except NotFoundError as nfe:
         raise TypeError(f"sobject not found: {name}") from nfe
 
-    datacls = make_datacls(
-        metadata.name,
-        [(field.name, sobject_field_type(field)) for field in metadata.fields],
+    datacls = _sobject_datacls(
+        metadata.name, tuple((f.name, f.type, f.length) for f in metadata.fields)
     )
 
     codec = get_codec(JSON, datacls)
@@ -289,7 +351,7 @@ async def sobject_data_resource(client: Client, name: str):
         async def get(self) -> datacls:
             path = metadata.urls.rowTemplate.format(ID=self.id)
             async with client.request(method="GET", path=path) as response:
-                return codec.decode(await response.json())
+                return codec.decode(await read_json(response))
 
     @resource
     class SObjectResource:
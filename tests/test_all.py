@@ -2,6 +2,7 @@ import pytest
 
 import aiohttp
 import asyncio
+import fondat.csv
 import fondat.salesforce.bulk
 import fondat.salesforce.client
 import fondat.salesforce.jobs
@@ -10,8 +11,13 @@ import fondat.salesforce.oauth
 import fondat.salesforce.service as service
 import fondat.salesforce.sobjects
 import os
+import types
 
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from fondat.error import NotFoundError
+from fondat.validation import MaxLen
+from typing import Annotated, Optional
 
 
 pytestmark = pytest.mark.asyncio
@@ -130,12 +136,271 @@ async def test_sobjects_describe_common(client):
     await sobjects["Product2"].describe()
 
 
+async def test_sobjects_describe_many(client):
+    sobjects = fondat.salesforce.sobjects.sobjects_metadata_resource(client)
+    names = ["Account", "Contact", "Lead", "Opportunity", "Product2"]
+    assert [m.name for m in await sobjects.describe_many(names)] == names
+
+
 async def test_invalid_sobjects_metadata(client):
     sobjects = fondat.salesforce.sobjects.sobjects_metadata_resource(client)
     with pytest.raises(NotFoundError):
         await sobjects["account"].describe()  # lower case
 
 
+async def test_create_default_session():
+    async with fondat.salesforce.client.Client.create_default_session() as session:
+        assert session.connector.limit == 32
+        assert session.connector.limit_per_host == 32
+        assert session.timeout.total == 120
+
+
+def _stub_sobject(*fields):
+    return types.SimpleNamespace(
+        name="Stub",
+        fields=[
+            types.SimpleNamespace(name=name, type=field_type, length=length)
+            for name, field_type, length in fields
+        ],
+    )
+
+
+async def test_bulk_page_fetch_error_retries():
+    pages = {
+        None: fondat.salesforce.jobs.QueryResultsPage(items=[["Id"], ["a"]], cursor=b"2"),
+        b"2": fondat.salesforce.jobs.QueryResultsPage(items=[["Id"], ["b"]], cursor=None),
+    }
+    failures = {b"2"}
+
+    class StubQuery:
+        async def get(self):
+            return types.SimpleNamespace(state="JobComplete")
+
+        async def results(self, limit, cursor):
+            if cursor in failures:
+                failures.remove(cursor)
+                raise RuntimeError("fetch failed")
+            return pages[cursor]
+
+        async def delete(self):
+            pass
+
+    query = fondat.salesforce.bulk.SObjectQuery(
+        None, _stub_sobject(("Id", "id", 18)), fields=["Id"]
+    )
+    query.query = StubQuery()
+    assert (await asyncio.wait_for(query.__anext__(), 1))["Id"] == "a"
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(query.__anext__(), 1)
+    assert (await asyncio.wait_for(query.__anext__(), 1))["Id"] == "b"
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(query.__anext__(), 1)
+    await query.__aexit__(None, None, None)
+
+
+async def test_describe_task_survives_caller_cancel():
+    client = fondat.salesforce.client.Client()
+    client._describe_inflight = {}
+    calls = 0
+    release = asyncio.Event()
+
+    async def describe():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "metadata"
+
+    async def caller():
+        return await asyncio.shield(client.describe_task("Account", describe))
+
+    t1 = asyncio.create_task(caller())
+    t2 = asyncio.create_task(caller())
+    await asyncio.sleep(0)
+    t1.cancel()
+    release.set()
+    assert await asyncio.wait_for(t2, 1) == "metadata"
+    assert t1.cancelled()
+    assert calls == 1
+    assert "Account" not in client._describe_inflight
+
+
+def test_rows_decoder_matches_typeddict_codec():
+    td = fondat.salesforce.bulk._query_typeddict(
+        (
+            ("Id", "id", 18),
+            ("Name", "string", 255),
+            ("Amount", "currency", 0),
+            ("Count", "int", 0),
+            ("Active", "boolean", 0),
+            ("Created", "datetime", 0),
+        )
+    )
+    assert list(td.__annotations__) == ["Id", "Name", "Amount", "Count", "Active", "Created"]
+    header = ["Created", "Active", "Count", "Amount", "Name", "Id"]  # not in TypedDict order
+    rows = [
+        ["2022-01-02T03:04:05+00:00", "true", "3", "1.5", "Acme", "0015e00000BOnAVAA1"],
+        ["", "false", "0", "0.0", "", "0015e00000BOnAVAA2"],
+        ["", "", "", "", "", ""],
+    ]
+    decoded = fondat.salesforce.bulk._rows_decoder(td, tuple(header))(rows)
+    codec = fondat.csv.typeddict_codec(td, header)
+    assert decoded == [codec.decode(row) for row in rows]
+    assert decoded[0] == {
+        "Created": datetime(2022, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "Active": True,
+        "Count": 3,
+        "Amount": 1.5,
+        "Name": "Acme",
+        "Id": "0015e00000BOnAVAA1",
+    }
+    assert decoded[2] == dict.fromkeys(header)
+
+
+def test_column_decoder_unwraps_annotated():
+    column_decoder = fondat.salesforce.bulk._column_decoder
+    assert column_decoder(Optional[Annotated[str, MaxLen(10)]]) is None
+    assert column_decoder(Optional[Annotated[int, MaxLen(10)]])("42") == 42
+
+
+def test_complete_records_end():
+    complete_records_end = fondat.salesforce.jobs._complete_records_end
+    assert complete_records_end("") == 0
+    assert complete_records_end("a,b") == 0
+    assert complete_records_end("a,b\nc,d") == 4
+    assert complete_records_end("a,b\r\nc,d\r\n") == 10
+    assert complete_records_end('a,"b\nc') == 0  # newline within quoted value
+    assert complete_records_end('x\na,"b\nc') == 2
+    assert complete_records_end('a,"b""\nc",d\ne') == 12  # escaped quote
+    assert complete_records_end('b"\nc', quoted=True) == 3  # starts within quoted value
+    assert complete_records_end('b\nc",d', quoted=True) == 0
+
+
+async def _read_csv_chunks(data: bytes, size: int) -> list[list[str]]:
+    async def chunks():
+        for n in range(0, len(data), size):
+            yield data[n : n + size]
+
+    return await fondat.salesforce.jobs._read_csv(chunks())
+
+
+async def test_read_csv_chunked():
+    rows = [
+        ["Id", "Name", "Description"],
+        ["1", "Café", 'multi\nline "quoted"'],
+        ["2", "", 'ends with ""\n'],
+        ["3", "naïve, résumé", ""],
+    ]
+    for line_ending in ("\n", "\r\n"):
+        data = "".join(
+            ",".join('"' + v.replace('"', '""') + '"' if v else "" for v in row) + line_ending
+            for row in rows
+        ).encode()
+        for size in range(1, len(data) + 1):  # splits quotes, newlines and UTF-8 sequences
+            assert await _read_csv_chunks(data, size) == rows
+
+
+class _StubSession:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.authorizations = []
+
+    @asynccontextmanager
+    async def request(self, method, url, headers, **kwargs):
+        self.authorizations.append(headers["Authorization"])
+        await asyncio.sleep(0)
+        status = self.statuses.pop(0) if self.statuses else 200
+        yield types.SimpleNamespace(status=status, text=lambda: asyncio.sleep(0, ""))
+
+
+def _auth_client(statuses=()):
+    client = fondat.salesforce.client.Client()
+    client.session = _StubSession(statuses)
+    client.retries = 0
+    client.token = None
+    client._auth_lock = asyncio.Lock()
+    client.authentications = 0
+
+    async def authenticate(session):
+        client.authentications += 1
+        await asyncio.sleep(0)
+        return types.SimpleNamespace(
+            access_token=f"token{client.authentications}", instance_url="https://example.com"
+        )
+
+    client.authenticate = authenticate
+    return client
+
+
+async def test_request_concurrent_authentication():
+    client = _auth_client()
+
+    async def request():
+        async with client.request("GET", "/path") as response:
+            return response.status
+
+    assert await asyncio.gather(*(request() for _ in range(5))) == [200] * 5
+    assert client.authentications == 1
+    assert client.session.authorizations == ["Bearer token1"] * 5
+
+
+async def test_request_reauthenticates_on_unauthorized():
+    client = _auth_client([401])
+    async with client.request("GET", "/path") as response:
+        assert response.status == 200
+    assert client.authentications == 2
+    assert client.session.authorizations == ["Bearer token1", "Bearer token2"]
+    assert client.token.access_token == "token2"
+
+
+def test_resource_paths_resolved_on_use():
+    client = fondat.salesforce.client.Client()
+    client.resources = {"sobjects": "/services/data/v54.0/sobjects"}
+    assert client.sobjects_path == "/services/data/v54.0/sobjects"
+    with pytest.raises(NotFoundError):
+        client.jobs_query_path
+    client.resources["jobs"] = "/services/data/v54.0/jobs"
+    assert client.jobs_query_path == "/services/data/v54.0/jobs/query"
+
+
+def _metadata_client(monkeypatch, ttl):
+    clock = types.SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        fondat.salesforce.client, "time", types.SimpleNamespace(monotonic=lambda: clock.now)
+    )
+    client = fondat.salesforce.client.Client()
+    client.metadata_ttl = ttl
+    client._metadata_cache = {}
+    return client, clock
+
+
+def test_metadata_cache_expires(monkeypatch):
+    client, clock = _metadata_client(monkeypatch, 60)
+    metadata = object()
+    client.cache_metadata("Account", metadata)
+    assert client.get_cached_metadata("Account") is metadata
+    clock.now += 59
+    assert client.get_cached_metadata("Account") is metadata
+    clock.now += 1
+    assert client.get_cached_metadata("Account") is None
+
+
+def test_metadata_cache_disabled(monkeypatch):
+    client, clock = _metadata_client(monkeypatch, 0)
+    client.cache_metadata("Account", object())
+    assert client.get_cached_metadata("Account") is None
+
+
+def test_metadata_cache_invalidate(monkeypatch):
+    client, clock = _metadata_client(monkeypatch, 60)
+    client.cache_metadata("Account", object())
+    client.cache_metadata("Contact", contact := object())
+    client.invalidate_metadata("Account")
+    assert client.get_cached_metadata("Account") is None
+    assert client.get_cached_metadata("Contact") is contact
+    client.invalidate_metadata()
+    assert client.get_cached_metadata("Contact") is None
+
+
 # async def test_sobjects_describe_all(client):
 #     sobjects = fondat.salesforce.sobjects.sobjects_metadata_resource(client)
 #     for name in [sobject.name for sobject in (await sobjects.get()).sobjects]: